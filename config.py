@@ -2,14 +2,39 @@
 Configuration for DSPy language models.
 """
 
+import contextlib
+import importlib.util
+import json
 import os
 import dspy
 
 
+# Exact-match prediction cache in front of model forward() calls (see models/cache.py).
+# Disable with `python main.py --no-cache` for clean baselines.
+CACHE_ENABLED = True
+
+# Semantic cache in front of model forward() calls (see models/cache.py).
+# Requires the optional sentence-transformers and faiss-cpu packages.
+SEMANTIC_CACHE = False
+SIM_THRESHOLD = 0.85  # Minimum cosine similarity to reuse a cached prediction
+SEMANTIC_CACHE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SEMANTIC_CACHE_DIR = os.path.join(".cache", "semantic")
+
+# Task name -> LM routed to that task's modules (see configure_lm(per_task=...))
+_TASK_LMS = {}
+
+# (model string, frozen kwargs) -> LM, so repeated configure_lm() calls reuse clients
+_LM_CACHE = {}
+_http_client_configured = False
+
+
 def configure_lm(
     provider: str = "openai",
     model: str = "gpt-4o-mini",
     api_key: str = None,
+    per_task: dict = None,
+    latency_optimized: bool = False,
+    cache_prefix: bool = False,
     **kwargs
 ):
     """
@@ -19,48 +44,166 @@ def configure_lm(
         provider: LLM provider (e.g., 'openai', 'anthropic', 'together')
         model: Model name (e.g., 'gpt-4o-mini', 'claude-3-5-sonnet-20241022')
         api_key: Optional API key (defaults to environment variable)
+        per_task: Optional mapping of task name -> model to route that task's
+            modules to a different (e.g. cheaper) LM; other tasks use the default.
+            Replaces any previous routing; when omitted, existing routing is kept
+        latency_optimized: Request the provider's low-latency inference tier
+            (see PROVIDER_CONFIGS). Faster per call, but billed at a higher
+            per-token price
+        cache_prefix: Enable provider prompt caching for the static prompt
+            prefix (signature instructions and demos) that every call repeats
         **kwargs: Additional arguments for the LM
 
     Returns:
         Configured DSPy LM instance
     """
-    # Construct the model string
-    if "/" in model:
-        model_string = model
-    else:
-        model_string = f"{provider}/{model}"
+    provider_flags = {"latency_optimized": latency_optimized, "cache_prefix": cache_prefix}
 
-    # Create and configure the LM
-    lm = dspy.LM(model_string, **kwargs)
+    # Create (or reuse) and configure the LM
+    lm = _get_lm(_model_string(provider, model), **provider_flags, **kwargs)
     dspy.configure(lm=lm)
 
+    # Create the per-task LMs, activated by task_lm() inside each module.
+    # Routing is only replaced when per_task is passed (per_task={} clears it).
+    if per_task is not None:
+        _TASK_LMS.clear()
+    for task, task_model in (per_task or {}).items():
+        _TASK_LMS[task] = _get_lm(_model_string(provider, task_model), **provider_flags, **kwargs)
+
     return lm
 
 
-def get_default_lm():
+def _get_lm(
+    model_string: str,
+    latency_optimized: bool = False,
+    cache_prefix: bool = False,
+    **kwargs
+):
+    """
+    Get a cached LM for this model and kwargs, creating it on first use.
+
+    Latency and prompt caching templates are looked up for this model's own
+    provider and merged into this LM's kwargs only.
+    """
+    _configure_http_client()
+
+    provider_config = PROVIDER_CONFIGS.get(model_string.split("/", 1)[0], {})
+    if latency_optimized:
+        _merge_kwargs(kwargs, provider_config.get("latency_optimized", {}))
+    if cache_prefix:
+        _merge_kwargs(kwargs, provider_config.get("prompt_cache", {}))
+
+    key = (model_string, json.dumps(kwargs, sort_keys=True, default=repr))
+    if key not in _LM_CACHE:
+        _LM_CACHE[key] = dspy.LM(model_string, **kwargs)
+    return _LM_CACHE[key]
+
+
+def _configure_http_client():
+    """
+    Share one pooled HTTP client across all LM calls.
+
+    Keeps TCP/TLS connections alive across the concurrent evaluation calls.
+    HTTP/2 is used when the optional h2 package is installed. Leaves any
+    client the caller already set on litellm untouched.
+    """
+    global _http_client_configured
+    if _http_client_configured:
+        return
+    _http_client_configured = True
+
+    import httpx
+    import litellm
+
+    http2 = importlib.util.find_spec("h2") is not None
+    limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    if litellm.client_session is None:
+        litellm.client_session = httpx.Client(http2=http2, limits=limits)
+    if litellm.aclient_session is None:
+        litellm.aclient_session = httpx.AsyncClient(http2=http2, limits=limits)
+
+
+def _merge_kwargs(kwargs: dict, template: dict):
+    """Merge a PROVIDER_CONFIGS template into LM kwargs without dropping user values."""
+    for key, value in template.items():
+        if isinstance(value, dict):
+            kwargs[key] = {**value, **kwargs.get(key, {})}
+        else:
+            kwargs.setdefault(key, value)
+
+
+def _model_string(provider: str, model: str) -> str:
+    """Construct the DSPy model string (e.g. 'openai/gpt-5-mini')."""
+    if "/" in model:
+        return model
+    return f"{provider}/{model}"
+
+
+def get_task_lm(task: str):
+    """Get the LM routed to a task, or None if it uses the default LM."""
+    return _TASK_LMS.get(task)
+
+
+def task_lm(task: str):
+    """Context manager that activates the LM routed to a task, if any."""
+    lm = get_task_lm(task)
+    if lm is None:
+        return contextlib.nullcontext()
+    return dspy.context(lm=lm)
+
+
+def get_default_lm(per_task: dict = None, cache: bool = True):
     """
     Get the default language model configuration.
     Uses OpenAI GPT-5-mini by default with retry logic for rate limits.
 
     Set OPENAI_API_KEY environment variable before running.
+
+    Args:
+        per_task: Optional mapping of task name -> model (see configure_lm)
+        cache: Whether DSPy may serve repeated calls from its completion cache
     """
     return configure_lm(
         provider="openai",
         model="gpt-5-mini",
+        per_task=per_task,
+        cache=cache,
         num_retries=5,  # Retry up to 5 times on rate limit errors
         timeout=60.0    # 60 second timeout per request
     )
 
 
 # Example configurations for different providers
+# "latency_optimized" holds request fields merged in by configure_lm(latency_optimized=True)
+# "prompt_cache" holds request fields merged in by configure_lm(cache_prefix=True)
 PROVIDER_CONFIGS = {
     "openai": {
         "model": "gpt-5-mini",
-        "env_var": "OPENAI_API_KEY"
+        "env_var": "OPENAI_API_KEY",
+        "latency_optimized": {
+            "extra_body": {"service_tier": "priority"}
+        },
+        # Prefixes over 1024 tokens are cached automatically; the key improves hit rate
+        "prompt_cache": {
+            "prompt_cache_key": "dspy-gepa-example"
+        }
     },
     "anthropic": {
         "model": "claude-3-5-sonnet-20241022",
-        "env_var": "ANTHROPIC_API_KEY"
+        "env_var": "ANTHROPIC_API_KEY",
+        "prompt_cache": {
+            "cache_control_injection_points": [{"location": "message", "role": "system"}]
+        }
+    },
+    "bedrock": {
+        "model": "us.anthropic.claude-3-5-haiku-20241022-v1:0",
+        "env_var": "AWS_ACCESS_KEY_ID",
+        "latency_optimized": {
+            "performanceConfig": {"latency": "optimized"}
+        },
+        "prompt_cache": {
+            "cache_control_injection_points": [{"location": "message", "role": "system"}]
+        }
     },
     "together": {
         "model": "meta-llama/Llama-3-70b-chat-hf",
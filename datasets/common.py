@@ -0,0 +1,41 @@
+"""Common dataset utilities shared across tasks."""
+
+import dspy
+from typing import List, Sequence, Tuple
+
+from normalization import normalize
+
+
+def create_examples(
+    data: Sequence[Tuple[str, ...]],
+    fields: Tuple[str, ...],
+    input_fields: Tuple[str, ...],
+    normalize_fields: Tuple[str, ...] = (),
+) -> List[dspy.Example]:
+    """
+    Build DSPy examples from raw data tuples.
+
+    The normalized value of each field in normalize_fields is precomputed and
+    stored as example._<field>_norm, so metrics don't re-normalize it on
+    every call.
+
+    Args:
+        data: Rows of field values, in the same order as fields
+        fields: Field name for each position in a row
+        input_fields: Fields to mark as inputs (the rest are labels)
+        normalize_fields: Label fields whose metric reads a precomputed
+            normalized value
+
+    Returns:
+        List of DSPy Examples with inputs marked
+    """
+    fields = tuple(fields)
+    inputs = tuple(input_fields)
+    if not all(len(item) == len(fields) for item in data):
+        raise ValueError(f"Every row must have {len(fields)} values: {fields}")
+
+    examples = [dspy.Example(**dict(zip(fields, item))).with_inputs(*inputs) for item in data]
+    for example in examples:
+        for field in normalize_fields:
+            setattr(example, f"_{field}_norm", normalize(str(example[field])))
+    return examples
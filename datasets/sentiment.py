@@ -1,10 +1,15 @@
 """Sentiment classification dataset."""
 
-import dspy
-from typing import List, Tuple
+import functools
 
+from .common import create_examples
 
-TRAIN_DATA = [
+FIELDS = ("text", "sentiment")
+INPUT_FIELDS = ("text",)
+NORMALIZE_FIELDS = ("sentiment",)  # Precomputed for the accuracy metric
+
+
+TRAIN_DATA = (
     ("This movie was absolutely fantastic! I loved every minute.", "positive"),
     ("Terrible experience. Would not recommend to anyone.", "negative"),
     ("Best purchase I've made all year! Highly recommend.", "positive"),
@@ -13,26 +18,24 @@ TRAIN_DATA = [
     ("Poor customer service and broken product.", "negative"),
     ("Exceeded all my expectations. Will buy again!", "positive"),
     ("Worst meal I've ever had. Don't go there.", "negative"),
-]
+)
 
-DEV_DATA = [
+DEV_DATA = (
     ("This product is incredible! Worth every penny.", "positive"),
     ("Not good at all. Returned it immediately.", "negative"),
     ("Absolutely love it! Five stars!", "positive"),
     ("Horrible quality. Very upset with this purchase.", "negative"),
-]
+)
 
 
+@functools.cache
 def get_data():
-    """Get sentiment classification train and dev datasets."""
-    train = []
-    for text, sentiment in TRAIN_DATA:
-        ex = dspy.Example(text=text, sentiment=sentiment)
-        train.append(ex.with_inputs("text"))
-
-    dev = []
-    for text, sentiment in DEV_DATA:
-        ex = dspy.Example(text=text, sentiment=sentiment)
-        dev.append(ex.with_inputs("text"))
-
+    """
+    Get sentiment classification train and dev datasets.
+
+    Cached after the first call; callers must not mutate the returned lists.
+    Use get_data.cache_clear() to rebuild them.
+    """
+    train = create_examples(TRAIN_DATA, FIELDS, INPUT_FIELDS, NORMALIZE_FIELDS)
+    dev = create_examples(DEV_DATA, FIELDS, INPUT_FIELDS, NORMALIZE_FIELDS)
     return train, dev
@@ -11,13 +11,16 @@ Usage:
     python main.py --task sentiment
     python main.py --task qa
     python main.py --task math
+    python main.py --task sentiment --no-cache  # Disable all caches for a clean baseline
 """
 
 import argparse
 import dspy
 from dspy.teleprompt import GEPA
 
+import config
 from config import get_default_lm
+from metrics import evaluate_model, evaluate_model_batch
 from tasks import TASKS
 
 
@@ -27,19 +30,26 @@ def run_baseline_evaluation(task_config, model, dev_examples):
     print("-" * 60)
 
     metric = task_config["metric"]
-    correct = 0
 
-    for example in dev_examples:
-        # Get inputs dynamically based on task
-        inputs = {field: getattr(example, field) for field in task_config["input_fields"]}
-        prediction = model(**inputs)
-        is_correct = metric(example, prediction)
-        correct += is_correct
-
-        # Display results (task-specific formatting)
-        print_example_result(example, prediction, is_correct, task_config)
+    if task_config["batch"]:
+        score = evaluate_model_batch(model, dev_examples, metric, verbose=True)
+        print(f"Baseline Accuracy: {score:.1%} (via Batch API)")
+        print()
+        return score
+
+    # Predictions run concurrently; results are displayed as they complete
+    score = evaluate_model(
+        model,
+        dev_examples,
+        metric,
+        batch_model_class=task_config["batch_model_class"],
+        batch_metric=task_config["batch_metric"],
+        on_result=lambda example, prediction, is_correct: print_example_result(
+            example, prediction, is_correct, task_config
+        ),
+    )
 
-    score = correct / len(dev_examples)
+    correct = round(score * len(dev_examples))
     print(f"Baseline Accuracy: {score:.1%} ({correct}/{len(dev_examples)})")
     print()
     return score
@@ -49,7 +59,7 @@ def run_gepa_optimization(task_config, train_examples, dev_examples):
     """Run GEPA optimization (generic for all tasks)."""
     print("Step 2: Running GEPA optimization...")
     print("-" * 60)
-    print(f"GEPA Config: auto={task_config['gepa_auto']}")
+    print(f"GEPA Config: auto={task_config['gepa_auto']}, threads={task_config['gepa_num_threads']}")
     print("This will take a few moments as GEPA evolves the prompts...")
     print()
 
@@ -59,13 +69,15 @@ def run_gepa_optimization(task_config, train_examples, dev_examples):
         temperature=1.0,
         max_tokens=16000,  # Reasoning models require >= 16000
         num_retries=5,  # Retry up to 5 times on rate limit errors
-        timeout=60.0    # 60 second timeout per request
+        timeout=60.0,   # 60 second timeout per request
+        cache=config.CACHE_ENABLED,
     )
 
     optimizer = GEPA(
         metric=task_config["metric"],
         auto=task_config["gepa_auto"],
         reflection_lm=reflection_lm,
+        num_threads=task_config["gepa_num_threads"],  # Evaluate candidates in parallel
     )
 
     optimized = optimizer.compile(
@@ -85,39 +97,48 @@ def run_optimized_evaluation(task_config, model, dev_examples):
     print("-" * 60)
 
     metric = task_config["metric"]
-    correct = 0
 
-    for example in dev_examples:
-        inputs = {field: getattr(example, field) for field in task_config["input_fields"]}
-        prediction = model(**inputs)
-        is_correct = metric(example, prediction)
-        correct += is_correct
-
-        print_example_result(example, prediction, is_correct, task_config)
+    if task_config["batch"]:
+        score = evaluate_model_batch(model, dev_examples, metric, verbose=True)
+        print(f"Optimized Accuracy: {score:.1%} (via Batch API)")
+        print()
+        return score
+
+    score = evaluate_model(
+        model,
+        dev_examples,
+        metric,
+        batch_model_class=task_config["batch_model_class"],
+        batch_metric=task_config["batch_metric"],
+        on_result=lambda example, prediction, is_correct: print_example_result(
+            example, prediction, is_correct, task_config
+        ),
+    )
 
-    score = correct / len(dev_examples)
+    correct = round(score * len(dev_examples))
     print(f"Optimized Accuracy: {score:.1%} ({correct}/{len(dev_examples)})")
     print()
     return score
 
 
 def print_example_result(example, prediction, is_correct, task_config):
-    """Print example result with task-specific formatting."""
+    """Print example result with task-specific formatting (prediction is None if the call failed)."""
     check = '✓' if is_correct else '✗'
+    field = task_config["output_field"]
+    expected = getattr(example, field)
+    predicted = getattr(prediction, field) if prediction is not None else "(failed)"
 
     if task_config["input_fields"] == ["text"]:
         # Sentiment task
         print(f"Text: {example.text[:50]}...")
-        print(f"Expected: {example.sentiment} | Predicted: {prediction.sentiment} | {check}")
     elif task_config["input_fields"] == ["problem"]:
         # Math task
         print(f"Problem: {example.problem}")
-        print(f"Expected: {example.answer} | Predicted: {prediction.answer} | {check}")
     else:
         # QA task
         print(f"Q: {example.question}")
         print(f"Context: {example.context[:60]}...")
-        print(f"Expected: {example.answer} | Predicted: {prediction.answer} | {check}")
+    print(f"Expected: {expected} | Predicted: {predicted} | {check}")
     print()
 
 
@@ -185,8 +206,17 @@ def main():
         default="sentiment",
         help="Task to run (default: sentiment)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the prediction caches and DSPy's completion cache (for clean baselines)"
+    )
     args = parser.parse_args()
 
+    if args.no_cache:
+        config.CACHE_ENABLED = False
+        config.SEMANTIC_CACHE = False
+
     # Get task configuration
     task_config = TASKS[args.task]
 
@@ -195,8 +225,8 @@ def main():
     print("=" * 60)
     print()
 
-    # Configure LM
-    get_default_lm()
+    # Configure LM (the task's modules switch to their routed LM)
+    get_default_lm(per_task={args.task: task_config["lm_model"]}, cache=config.CACHE_ENABLED)
 
     # Load data
     train_examples, dev_examples = task_config["get_data"]()
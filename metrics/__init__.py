@@ -1,14 +1,33 @@
 """Evaluation metrics for all tasks."""
 
 from .sentiment import accuracy as sentiment_accuracy
+from .sentiment import accuracy_batch as sentiment_accuracy_batch
 from .qa import accuracy as qa_accuracy
 from .math import accuracy as math_accuracy
-from .common import exact_match, evaluate_model
+from .common import (
+    normalize,
+    normalized_label,
+    exact_match,
+    make_exact_match,
+    evaluate_model,
+    aevaluate_model,
+    evaluate_candidates,
+    RateLimiter,
+)
+from .batch import evaluate_model_batch
 
 __all__ = [
     "sentiment_accuracy",
+    "sentiment_accuracy_batch",
     "qa_accuracy",
     "math_accuracy",
+    "normalize",
+    "normalized_label",
     "exact_match",
+    "make_exact_match",
     "evaluate_model",
+    "aevaluate_model",
+    "evaluate_candidates",
+    "RateLimiter",
+    "evaluate_model_batch",
 ]
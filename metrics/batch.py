@@ -0,0 +1,183 @@
+"""Offline evaluation through the OpenAI Batch API."""
+
+import io
+import json
+import logging
+import time
+from typing import Callable, List
+
+import dspy
+from pydantic import create_model
+
+from config import get_task_lm
+
+
+logger = logging.getLogger(__name__)
+
+
+def _get_predictor(model: dspy.Module):
+    """Return the single predictor inside a module, or raise if there are several."""
+    predictors = [predictor for _, predictor in model.named_predictors()]
+    if len(predictors) != 1:
+        raise ValueError(
+            f"Batch evaluation needs exactly one predictor, found {len(predictors)}"
+        )
+    return predictors[0]
+
+
+def _response_format(adapter, signature):
+    """
+    Get the response_format a real-time call through this adapter would send.
+
+    JSONAdapter constrains output with a strict json_schema built from the
+    signature's output fields (e.g. the enum of a Literal field); other
+    adapters send none. The schema is built here with pydantic rather than
+    through DSPy internals, and falls back to plain JSON mode with a warning
+    for output types strict mode can't express.
+    """
+    if not isinstance(adapter, dspy.JSONAdapter):
+        return None
+
+    fields = {name: (field.annotation, ...) for name, field in signature.output_fields.items()}
+    try:
+        schema = create_model(f"{signature.__name__}Output", **fields).model_json_schema()
+    except Exception as e:
+        logger.warning("Can't build a JSON schema for %s (%s); using JSON mode", signature.__name__, e)
+        return {"type": "json_object"}
+
+    # Strict mode needs additionalProperties: false on every object, so only flat outputs qualify
+    if "$defs" in schema:
+        logger.warning("%s has nested output types; using JSON mode", signature.__name__)
+        return {"type": "json_object"}
+    schema["additionalProperties"] = False
+
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": signature.__name__, "strict": True, "schema": schema},
+    }
+
+
+def _build_request(predictor, lm, adapter, inputs: dict, custom_id: str, response_format=None) -> dict:
+    """Render one example into a Batch API chat completion request."""
+    messages = adapter.format(predictor.signature, predictor.demos, inputs)
+
+    # Batch requests go straight to OpenAI, so drop the "openai/" provider prefix
+    model_name = lm.model.split("/", 1)[-1]
+    body = {"model": model_name, "messages": messages}
+    for key in ("temperature", "max_tokens", "max_completion_tokens"):
+        if lm.kwargs.get(key) is not None:
+            body[key] = lm.kwargs[key]
+    if response_format is not None:
+        body["response_format"] = response_format
+
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": body,
+    }
+
+
+def evaluate_model_batch(
+    model: dspy.Module,
+    examples: List[dspy.Example],
+    metric: Callable,
+    poll_interval: float = 30.0,
+    client=None,
+    verbose: bool = False,
+) -> float:
+    """
+    Evaluate a model through the OpenAI Batch API.
+
+    Prompts are rendered locally with the active DSPy adapter, submitted as a
+    single batch job, and the completions are parsed back into predictions
+    before scoring. Batch jobs cost half as much as real-time calls but can
+    take up to 24 hours, so this is only suited to offline evaluation runs.
+
+    Args:
+        model: DSPy Module with a single predictor to evaluate
+        examples: List of examples to evaluate on
+        metric: Metric function to use
+        poll_interval: Seconds to wait between batch status checks
+        client: Optional OpenAI client (defaults to a new client from the environment)
+        verbose: Whether to print how many results were parsed, failed or missing
+
+    Returns:
+        Accuracy score (fraction correct)
+    """
+    if not examples:
+        return 0.0
+
+    from openai import OpenAI
+
+    client = client or OpenAI()
+    predictor = _get_predictor(model)
+    lm = predictor.lm or get_task_lm(getattr(model, "task", None)) or dspy.settings.lm
+    adapter = getattr(model, "adapter", None) or dspy.settings.adapter or dspy.ChatAdapter()
+
+    response_format = _response_format(adapter, predictor.signature)
+
+    # Write one JSONL request per example
+    lines = []
+    for i, example in enumerate(examples):
+        request = _build_request(
+            predictor, lm, adapter, example.inputs().toDict(), str(i), response_format
+        )
+        lines.append(json.dumps(request))
+    payload = io.BytesIO("\n".join(lines).encode("utf-8"))
+
+    # Submit the batch job
+    batch_file = client.files.create(file=("batch.jsonl", payload), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+
+    # Poll until the job reaches a terminal state
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch.id} finished with status '{batch.status}'")
+
+    # Parse completions back into predictions keyed by custom_id
+    predictions = {}
+    failed = 0
+    unparseable = 0
+    output = client.files.content(batch.output_file_id).text
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        result = json.loads(line)
+        response = result.get("response") or {}
+        if response.get("status_code") != 200:
+            failed += 1
+            continue
+        content = response["body"]["choices"][0]["message"]["content"]
+        try:
+            fields = adapter.parse(predictor.signature, content)
+        except Exception:
+            unparseable += 1
+            continue
+        predictions[result["custom_id"]] = dspy.Prediction(**fields)
+
+    missing = len(examples) - len(predictions) - failed - unparseable
+    summary = (
+        f"Batch {batch.id}: parsed {len(predictions)}/{len(examples)} results "
+        f"({failed} failed, {unparseable} unparseable, {missing} missing)"
+    )
+    if verbose:
+        print(summary)
+    if len(predictions) < len(examples):
+        logger.warning(summary)
+
+    # Score locally (missing or unparseable results count as incorrect)
+    correct = 0
+    for i, example in enumerate(examples):
+        prediction = predictions.get(str(i))
+        if prediction is not None:
+            correct += metric(example, prediction)
+
+    return correct / len(examples)
@@ -1,14 +1,68 @@
 """Common evaluation utilities shared across tasks."""
 
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from typing import Callable, List
 import dspy
 
+from normalization import normalize
+
+
+logger = logging.getLogger(__name__)
+
+
+def normalized_label(example, field: str) -> str:
+    """
+    Get the normalized expected value of a label field.
+
+    Uses the value precomputed by create_examples() (stored as
+    example._<field>_norm) and falls back to normalizing on the fly for
+    examples built elsewhere.
+    """
+    cached = getattr(example, f"_{field}_norm", None)
+    if cached is not None:
+        return cached
+    return normalize(str(getattr(example, field)))
+
+
+def make_exact_match(example_proto: dspy.Example) -> Callable:
+    """
+    Build an exact match metric for the output field of an example.
+
+    The output field is resolved once from example_proto (its first
+    non-input field) instead of on every metric call.
+
+    Args:
+        example_proto: DSPy Example whose labels define the output field
+
+    Returns:
+        Metric function comparing that field case-insensitively
+    """
+    field = next(iter(example_proto.labels().keys()), None)
+    if field is None:
+        raise ValueError("Example has no output field to match on")
+
+    def _match(example, prediction, trace=None, pred_name=None, pred_trace=None) -> bool:
+        expected = getattr(example, field, None)
+        predicted = getattr(prediction, field, None)
+        if expected is None or predicted is None:
+            return False
+        return str(expected).lower().strip() == str(predicted).lower().strip()
+
+    return _match
+
 
 def exact_match(example, prediction, trace=None) -> bool:
     """
     Generic exact match metric for any output field.
 
-    Automatically detects the output field name from the example.
+    Automatically detects the output field name from the example. Prefer
+    make_exact_match() when scoring many examples with the same fields.
 
     Args:
         example: DSPy Example with expected output
@@ -18,56 +72,295 @@ def exact_match(example, prediction, trace=None) -> bool:
     Returns:
         True if outputs match exactly, False otherwise
     """
-    # Get the first non-input field as the output field
-    for key in example.__dict__:
-        if not key.startswith('_'):
-            expected = getattr(example, key, None)
-            predicted = getattr(prediction, key, None)
-            if expected is not None and predicted is not None:
-                return str(expected).lower() == str(predicted).lower()
+    try:
+        return make_exact_match(example)(example, prediction, trace)
+    except ValueError:
+        return False
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket that limits model calls to a requests-per-minute budget.
 
-    return False
+    Share one instance across evaluations to keep their combined call rate
+    under the provider's limit.
+    """
 
+    def __init__(self, requests_per_minute: float, burst: int = 8):
+        if requests_per_minute <= 0:
+            raise ValueError(f"requests_per_minute must be positive, got {requests_per_minute}")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+        self.rate = requests_per_minute / 60.0
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
 
-def evaluate_model(
+    def acquire(self):
+        """Block until a call may be made."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def _rate_limited(rate_limiter: RateLimiter, call: Callable):
+    rate_limiter.acquire()
+    return call()
+
+
+async def aevaluate_model(
     model: dspy.Module,
     examples: List[dspy.Example],
-    metric: Callable,
-    verbose: bool = False
+    metric: Callable = None,
+    verbose: bool = False,
+    concurrency: int = 8,
+    batch_model_class: type = None,
+    batch_size: int = 8,
+    batch_metric: Callable = None,
+    rate_limiter: RateLimiter = None,
+    on_result: Callable = None,
 ) -> float:
     """
-    Evaluate a model on a dataset using a given metric.
+    Evaluate a model on a dataset concurrently using a given metric.
+
+    DSPy modules are synchronous, so each prediction runs in a worker thread
+    and results are scored as they complete, overlapping metric work with
+    still in-flight calls. A semaphore caps the number of in-flight LLM
+    calls to stay under provider rate limits. Each call runs in a copy of the
+    caller's context, so a surrounding dspy.context(lm=...) still applies.
+
+    Failed calls count as incorrect and are logged; if every call fails, the
+    first error is re-raised instead of returning 0.0.
+
+    If batch_model_class is given, a batch program is derived from model with
+    batch_model_class.from_module(model), and examples are packed batch_size at
+    a time into a single call to it instead of calling model once per example.
 
     Args:
         model: DSPy Module to evaluate
         examples: List of examples to evaluate on
-        metric: Metric function to use
+        metric: Metric function to use (defaults to exact match on the output field)
         verbose: Whether to print per-example results
+        concurrency: Maximum number of concurrent model calls
+        batch_model_class: Optional module class with a from_module(model)
+            constructor whose instances take a list of input dicts and return
+            one prediction per input (e.g. BatchSentimentClassifier)
+        batch_size: Number of examples per batch call
+        batch_metric: Optional vectorized metric taking (examples, predictions)
+            and returning one match per example (e.g. a numpy bool array);
+            used instead of metric, scoring the whole set once all calls finish
+        rate_limiter: Optional RateLimiter each model call must acquire first
+        on_result: Optional callback called as on_result(example, prediction,
+            is_correct) for each scored example; prediction is None if its
+            call failed
 
     Returns:
         Accuracy score (fraction correct)
     """
-    correct = 0
     total = len(examples)
+    if total == 0:
+        return 0.0
+
+    if metric is None:
+        metric = make_exact_match(examples[0])
 
-    for i, example in enumerate(examples):
-        # Get input fields
-        input_dict = {k: v for k, v in example.__dict__.items()
-                      if not k.startswith('_') and k in example._input_keys}
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
 
-        # Run prediction
-        prediction = model(**input_dict)
+    batch_model = batch_model_class.from_module(model) if batch_model_class else None
 
-        # Evaluate
-        is_correct = metric(example, prediction)
-        correct += is_correct
+    # Get input fields (resolved once; all examples share the same inputs)
+    if examples[0]._input_keys is None:
+        raise ValueError("Examples must mark their inputs with .with_inputs(...)")
+    input_keys = tuple(examples[0]._input_keys)
+    input_dicts = [{k: example[k] for k in input_keys} for example in examples]
+
+    # Only a vectorized metric needs every prediction held at once
+    vectorized = batch_metric is not None
+    results = [None] * total if vectorized else None
+    correct = 0
+    failures = 0
+    first_error = None
+
+    def report(i, prediction, is_correct):
+        """Pass one scored example to on_result and print it if verbose."""
+        failed = isinstance(prediction, Exception)
+        if on_result is not None:
+            on_result(examples[i], None if failed else prediction, is_correct)
 
         if verbose:
             print(f"Example {i+1}/{total}: {'✓' if is_correct else '✗'}")
-            print(f"  Input: {input_dict}")
-            print(f"  Expected: {example.__dict__}")
-            print(f"  Predicted: {prediction.__dict__}")
+            print(f"  Input: {input_dicts[i]}")
+            print(f"  Expected: {examples[i].__dict__}")
+            if failed:
+                print(f"  Error: {prediction!r}")
+            else:
+                print(f"  Predicted: {prediction.__dict__}")
             print()
 
-    accuracy = correct / total if total > 0 else 0.0
-    return accuracy
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        async def run(indices, call):
+            """Run one model call and pair its predictions with example indices."""
+            if rate_limiter is not None:
+                call = partial(_rate_limited, rate_limiter, call)
+            # Worker threads don't inherit contextvars, so carry the caller's over
+            ctx = contextvars.copy_context()
+            async with semaphore:
+                try:
+                    result = await loop.run_in_executor(pool, ctx.run, call)
+                except Exception as e:
+                    return [(i, e) for i in indices]
+            if batch_model is None:
+                return [(indices[0], result)]
+            return list(zip(indices, result))
+
+        # Dispatch predictions
+        if batch_model is None:
+            tasks = [
+                asyncio.create_task(run([i], partial(model, **input_dicts[i])))
+                for i in range(total)
+            ]
+        else:
+            tasks = [
+                asyncio.create_task(run(
+                    list(range(start, min(start + batch_size, total))),
+                    partial(batch_model, inputs=input_dicts[start:start + batch_size]),
+                ))
+                for start in range(0, total, batch_size)
+            ]
+
+        # Score each result as it arrives, overlapping with in-flight calls
+        for future in asyncio.as_completed(tasks):
+            for i, prediction in await future:
+                failed = isinstance(prediction, Exception)
+                if failed:
+                    failures += 1
+                    first_error = first_error or prediction
+                    logger.warning("Example %d/%d failed: %r", i + 1, total, prediction)
+
+                if vectorized:
+                    results[i] = prediction
+                    continue
+
+                # Evaluate (failed calls count as incorrect)
+                is_correct = not failed and metric(examples[i], prediction)
+                correct += is_correct
+                report(i, prediction, is_correct)
+
+    if failures == total:
+        raise first_error
+
+    # Score the whole set in one call when a vectorized metric is available
+    if vectorized:
+        predictions = [None if isinstance(r, Exception) else r for r in results]
+        matches = batch_metric(examples, predictions)
+        for i, is_correct in enumerate(matches):
+            correct += bool(is_correct)
+            report(i, results[i], bool(is_correct))
+
+    return correct / total
+
+
+def evaluate_model(
+    model: dspy.Module,
+    examples: List[dspy.Example],
+    metric: Callable = None,
+    verbose: bool = False,
+    concurrency: int = 8,
+    batch_model_class: type = None,
+    batch_size: int = 8,
+    batch_metric: Callable = None,
+    rate_limiter: RateLimiter = None,
+    on_result: Callable = None,
+) -> float:
+    """
+    Evaluate a model on a dataset using a given metric.
+
+    Synchronous entry point for aevaluate_model(). When called from a running
+    event loop (e.g. a Jupyter notebook), the evaluation runs on its own loop
+    in a helper thread instead.
+
+    Args:
+        model: DSPy Module to evaluate
+        examples: List of examples to evaluate on
+        metric: Metric function to use (defaults to exact match on the output field)
+        verbose: Whether to print per-example results
+        concurrency: Maximum number of concurrent model calls
+        batch_model_class: Optional module class with a from_module(model)
+            constructor whose instances take a list of input dicts and return
+            one prediction per input (e.g. BatchSentimentClassifier)
+        batch_size: Number of examples per batch call
+        batch_metric: Optional vectorized metric taking (examples, predictions)
+            and returning one match per example (e.g. a numpy bool array);
+            used instead of metric, scoring the whole set once all calls finish
+        rate_limiter: Optional RateLimiter each model call must acquire first
+        on_result: Optional callback called as on_result(example, prediction,
+            is_correct) for each scored example; prediction is None if its
+            call failed
+
+    Returns:
+        Accuracy score (fraction correct)
+    """
+    coro = aevaluate_model(
+        model, examples, metric, verbose, concurrency, batch_model_class, batch_size, batch_metric,
+        rate_limiter, on_result,
+    )
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    # asyncio.run() can't nest inside a running loop, so use a fresh one in a thread
+    ctx = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(ctx.run, asyncio.run, coro).result()
+
+
+def evaluate_candidates(
+    candidates: List[dspy.Module],
+    examples: List[dspy.Example],
+    metric: Callable = None,
+    max_workers: int = 8,
+    requests_per_minute: float = None,
+    **kwargs,
+) -> List[float]:
+    """
+    Evaluate several candidate models in parallel.
+
+    Each candidate runs evaluate_model() in its own thread. When
+    requests_per_minute is set, all candidates share one RateLimiter so
+    their combined call rate stays under the provider limit.
+
+    Args:
+        candidates: DSPy Modules to evaluate (e.g. GEPA prompt candidates)
+        examples: List of examples to evaluate on
+        metric: Metric function to use
+        max_workers: Maximum number of candidates evaluated at once
+        requests_per_minute: Optional shared budget for model calls
+        **kwargs: Additional arguments for evaluate_model()
+
+    Returns:
+        Accuracy score for each candidate, in input order
+    """
+    if requests_per_minute is not None:
+        kwargs["rate_limiter"] = RateLimiter(requests_per_minute)
+
+    scores = [0.0] * len(candidates)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(evaluate_model, candidate, examples, metric, **kwargs): i
+            for i, candidate in enumerate(candidates)
+        }
+        for future in as_completed(futures):
+            scores[futures[future]] = future.result()
+
+    return scores
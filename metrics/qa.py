@@ -1,10 +1,12 @@
 """Question answering metrics."""
 
+from .common import normalize, normalized_label
+
 
 def accuracy(gold, pred, trace=None, pred_name=None, pred_trace=None) -> bool:
     """
     Check if predicted answer matches expected answer.
-    Uses case-insensitive exact match.
+    Uses normalized exact match (case, surrounding punctuation and whitespace ignored).
 
     Args:
         gold: DSPy Example with expected answer
@@ -14,8 +16,6 @@ def accuracy(gold, pred, trace=None, pred_name=None, pred_trace=None) -> bool:
         pred_trace: Trace of the prediction (unused)
 
     Returns:
-        True if answers match (case-insensitive), False otherwise
+        True if answers match after normalization, False otherwise
     """
-    expected = str(gold.answer).lower().strip()
-    predicted = str(pred.answer).lower().strip()
-    return expected == predicted
+    return normalized_label(gold, "answer") == normalize(str(pred.answer))
@@ -1,10 +1,22 @@
 """Sentiment classification metrics."""
 
+import sys
+
+import numpy as np
+
+from .common import normalize, normalized_label
+
+# Interned labels so matching is an identity check; anything else is invalid
+_LABELS = {"positive": sys.intern("positive"), "negative": sys.intern("negative")}
+
 
 def accuracy(gold, pred, trace=None, pred_name=None, pred_trace=None) -> bool:
     """
     Check if predicted sentiment matches expected sentiment.
 
+    Labels outside positive/negative never match, even if they are equal, and
+    missing or non-string predictions score as incorrect.
+
     Args:
         gold: DSPy Example with expected sentiment
         pred: Model prediction with sentiment field
@@ -13,6 +25,33 @@ def accuracy(gold, pred, trace=None, pred_name=None, pred_trace=None) -> bool:
         pred_trace: Trace of the prediction (unused)
 
     Returns:
-        True if sentiments match (case-insensitive), False otherwise
+        True if sentiments match after normalization, False otherwise
+    """
+    expected = _LABELS.get(normalized_label(gold, "sentiment"))
+    predicted = normalize(str(getattr(pred, "sentiment", "")))
+    return expected is not None and expected is _LABELS.get(predicted)
+
+
+def accuracy_batch(golds, preds) -> np.ndarray:
+    """
+    Check sentiment matches over a whole evaluation set at once.
+
+    Vectorized counterpart of accuracy() for evaluate_model(batch_metric=...):
+    labels are normalized with the same normalize() as accuracy(), then
+    compared and validated in a single pass. Keep using accuracy() wherever
+    DSPy expects a per-example metric.
+
+    Args:
+        golds: DSPy Examples with expected sentiment
+        preds: Model predictions with sentiment field (None for failed calls)
+
+    Returns:
+        Boolean array with one entry per example, True where sentiments match
     """
-    return gold.sentiment.lower() == pred.sentiment.lower()
+    expected = np.asarray([normalized_label(gold, "sentiment") for gold in golds], dtype=str)
+    predicted = np.asarray(
+        [normalize(str(getattr(pred, "sentiment", ""))) if pred is not None else "" for pred in preds],
+        dtype=str,
+    )
+    valid = np.isin(expected, list(_LABELS))
+    return (expected == predicted) & valid
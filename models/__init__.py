@@ -1,12 +1,19 @@
 """Model definitions for all tasks."""
 
-from .sentiment import SentimentClassification, SentimentClassifier
+from .sentiment import (
+    SentimentClassification,
+    SentimentClassifier,
+    BatchSentimentClassification,
+    BatchSentimentClassifier,
+)
 from .qa import QuestionAnswering, QAModule
 from .math import MathWordProblem, MathSolver
 
 __all__ = [
     "SentimentClassification",
     "SentimentClassifier",
+    "BatchSentimentClassification",
+    "BatchSentimentClassifier",
     "QuestionAnswering",
     "QAModule",
     "MathWordProblem",
@@ -0,0 +1,203 @@
+"""Caching layers in front of DSPy module forward() calls."""
+
+import atexit
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+import dspy
+
+import config
+
+
+def _namespace(module: dspy.Module) -> str:
+    """
+    Identify the prompts and LM behind a module.
+
+    GEPA produces many variants of the same module class with different
+    instructions, so cache entries are scoped to the exact prompt and model.
+    """
+    parts = [type(module).__name__]
+    for name, predictor in module.named_predictors():
+        parts.append(name)
+        parts.append(predictor.signature.instructions)
+        parts.append(repr(predictor.demos))
+    lm = config.get_task_lm(getattr(module, "task", None)) or dspy.settings.lm
+    parts.append(getattr(lm, "model", ""))
+    return hashlib.blake2b("\n".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _bind_inputs(signature: inspect.Signature, module, args, kwargs) -> dict:
+    """Resolve forward() arguments into a field name -> value dict."""
+    bound = signature.bind(module, *args, **kwargs)
+    inputs = dict(bound.arguments)
+    inputs.pop(next(iter(signature.parameters)))
+    return inputs
+
+
+def _record_trace(module: dspy.Module, inputs: dict, prediction: dspy.Prediction):
+    """Replay a cache hit into the DSPy trace so optimizers still see the call."""
+    predictors = module.predictors()
+    if len(predictors) == 1 and dspy.settings.trace is not None:
+        dspy.settings.trace.append((predictors[0], inputs, prediction))
+
+
+_EXACT_CACHE_SIZE = 4096
+_exact_cache: "OrderedDict[str, dict]" = OrderedDict()
+_exact_lock = threading.Lock()
+
+
+def exact_cache(forward):
+    """
+    Decorate a module's forward() with an exact-match memoization layer.
+
+    Predictions are keyed by a hash of the module's prompt and the JSON-encoded
+    inputs, so repeated GEPA evaluation passes over the same examples cost a
+    dict lookup instead of an LLM call. Holds at most 4096 entries (LRU).
+
+    Disabled when config.CACHE_ENABLED is False (``python main.py --no-cache``).
+    """
+    signature = inspect.signature(forward)
+
+    @functools.wraps(forward)
+    def wrapper(self, *args, **kwargs):
+        if not config.CACHE_ENABLED:
+            return forward(self, *args, **kwargs)
+
+        inputs = _bind_inputs(signature, self, args, kwargs)
+        payload = json.dumps({"namespace": _namespace(self), "inputs": inputs}, sort_keys=True, default=str)
+        key = hashlib.blake2b(payload.encode("utf-8")).hexdigest()
+
+        with _exact_lock:
+            cached = _exact_cache.get(key)
+            if cached is not None:
+                _exact_cache.move_to_end(key)
+        if cached is not None:
+            prediction = dspy.Prediction(**cached)
+            _record_trace(self, inputs, prediction)
+            return prediction
+
+        prediction = forward(self, **inputs)
+        with _exact_lock:
+            _exact_cache[key] = prediction.toDict()
+            if len(_exact_cache) > _EXACT_CACHE_SIZE:
+                _exact_cache.popitem(last=False)
+        return prediction
+
+    return wrapper
+
+
+class _SemanticIndex:
+    """In-process FAISS index of input embeddings and their cached predictions."""
+
+    def __init__(self, path: str, dim: int):
+        import faiss
+
+        self.path = path
+        self.lock = threading.Lock()
+        self.dirty = False
+        if os.path.exists(f"{path}.faiss"):
+            self.index = faiss.read_index(f"{path}.faiss")
+            with open(f"{path}.pkl", "rb") as f:
+                self.predictions = pickle.load(f)
+        else:
+            self.index = faiss.IndexFlatIP(dim)
+            self.predictions = []
+
+    def lookup(self, embedding, threshold: float):
+        """Return the cached prediction of the most similar input, if close enough."""
+        with self.lock:
+            if self.index.ntotal == 0:
+                return None
+            scores, ids = self.index.search(embedding, 1)
+        if scores[0][0] < threshold:
+            return None
+        return dspy.Prediction(**self.predictions[ids[0][0]])
+
+    def add(self, embedding, prediction: dspy.Prediction):
+        with self.lock:
+            self.index.add(embedding)
+            self.predictions.append(prediction.toDict())
+            self.dirty = True
+
+    def save(self):
+        import faiss
+
+        with self.lock:
+            if not self.dirty:
+                return
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            faiss.write_index(self.index, f"{self.path}.faiss")
+            with open(f"{self.path}.pkl", "wb") as f:
+                pickle.dump(self.predictions, f)
+            self.dirty = False
+
+
+_embedder = None
+_semantic_indexes = {}
+_semantic_lock = threading.Lock()
+
+
+def _embed(inputs: dict):
+    """Embed the concatenated input fields as a normalized (1, dim) float32 array."""
+    global _embedder
+    with _semantic_lock:
+        if _embedder is None:
+            from sentence_transformers import SentenceTransformer
+            _embedder = SentenceTransformer(config.SEMANTIC_CACHE_MODEL)
+    text = "\n".join(f"{key}: {value}" for key, value in inputs.items())
+    return _embedder.encode([text], normalize_embeddings=True).astype("float32")
+
+
+def _get_semantic_index(namespace: str, dim: int) -> _SemanticIndex:
+    with _semantic_lock:
+        if namespace not in _semantic_indexes:
+            path = os.path.join(config.SEMANTIC_CACHE_DIR, namespace)
+            _semantic_indexes[namespace] = _SemanticIndex(path, dim)
+        return _semantic_indexes[namespace]
+
+
+@atexit.register
+def _save_semantic_indexes():
+    for index in _semantic_indexes.values():
+        index.save()
+
+
+def semantic_cache(forward):
+    """
+    Decorate a module's forward() with a semantic memoization layer.
+
+    Inputs are embedded with a sentence-transformers model and looked up in a
+    FAISS inner-product index. If a previous input has cosine similarity of at
+    least config.SIM_THRESHOLD, its prediction is returned without calling the
+    LM. Indexes are persisted to config.SEMANTIC_CACHE_DIR on exit.
+
+    Disabled unless config.SEMANTIC_CACHE is True, since it needs the optional
+    sentence-transformers and faiss-cpu packages.
+    """
+    signature = inspect.signature(forward)
+
+    @functools.wraps(forward)
+    def wrapper(self, *args, **kwargs):
+        if not config.SEMANTIC_CACHE:
+            return forward(self, *args, **kwargs)
+
+        inputs = _bind_inputs(signature, self, args, kwargs)
+        embedding = _embed(inputs)
+        index = _get_semantic_index(_namespace(self), embedding.shape[1])
+
+        cached = index.lookup(embedding, config.SIM_THRESHOLD)
+        if cached is not None:
+            _record_trace(self, inputs, cached)
+            return cached
+
+        prediction = forward(self, **inputs)
+        index.add(embedding, prediction)
+        return prediction
+
+    return wrapper
@@ -2,6 +2,8 @@
 
 import dspy
 
+from config import task_lm
+
 
 def calculate(expression: str) -> str:
     """
@@ -58,6 +60,8 @@ class MathSolver(dspy.Module):
     calculator tool, and generating the final numerical answer.
     """
 
+    task = "math"
+
     def __init__(self):
         super().__init__()
         self.react = dspy.ReAct(
@@ -76,4 +80,5 @@ class MathSolver(dspy.Module):
         Returns:
             Prediction with answer field
         """
-        return self.react(problem=problem)
+        with task_lm(self.task):
+            return self.react(problem=problem)
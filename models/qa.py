@@ -2,6 +2,10 @@
 
 import dspy
 
+from config import task_lm
+
+from .cache import exact_cache, semantic_cache
+
 
 class QuestionAnswering(dspy.Signature):
     """Answer a question based on provided context."""
@@ -19,10 +23,14 @@ class QAModule(dspy.Module):
     a concise answer based on the provided context.
     """
 
+    task = "qa"
+
     def __init__(self):
         super().__init__()
         self.qa = dspy.ChainOfThought(QuestionAnswering)
 
+    @exact_cache
+    @semantic_cache
     def forward(self, question, context):
         """
         Answer a question based on context.
@@ -34,4 +42,5 @@ class QAModule(dspy.Module):
         Returns:
             Prediction with answer field
         """
-        return self.qa(question=question, context=context)
+        with task_lm(self.task):
+            return self.qa(question=question, context=context)
@@ -1,27 +1,43 @@
 """Sentiment classification models."""
 
 import dspy
+from typing import List, Literal
+
+from config import task_lm
+
+from .cache import exact_cache, semantic_cache
 
 
 class SentimentClassification(dspy.Signature):
     """Classify the sentiment of a text as positive or negative."""
 
     text: str = dspy.InputField(desc="The text to classify")
-    sentiment: str = dspy.OutputField(desc="Either 'positive' or 'negative'")
+    sentiment: Literal["positive", "negative"] = dspy.OutputField(desc="Either 'positive' or 'negative'")
 
 
 class SentimentClassifier(dspy.Module):
     """
-    A simple sentiment classifier using Chain of Thought reasoning.
+    A simple sentiment classifier using direct prediction.
 
     This module takes text as input and predicts whether the sentiment
-    is positive or negative.
+    is positive or negative. It uses dspy.Predict rather than Chain of
+    Thought: a binary label gains little from reasoning, and skipping the
+    reasoning field cuts output tokens, which dominate latency and cost.
+
+    The JSON adapter requests provider-side structured output, so the label
+    is constrained to the two allowed values where the provider supports it
+    (DSPy falls back to plain JSON mode otherwise).
     """
 
+    task = "sentiment"
+    adapter = dspy.JSONAdapter()
+
     def __init__(self):
         super().__init__()
-        self.classify = dspy.ChainOfThought(SentimentClassification)
+        self.classify = dspy.Predict(SentimentClassification)
 
+    @exact_cache
+    @semantic_cache
     def forward(self, text):
         """
         Classify the sentiment of the given text.
@@ -32,4 +48,83 @@ class SentimentClassifier(dspy.Module):
         Returns:
             Prediction with sentiment field
         """
-        return self.classify(text=text)
+        with task_lm(self.task), dspy.context(adapter=self.adapter):
+            return self.classify(text=text)
+
+
+class BatchSentimentClassification(dspy.Signature):
+    """Classify the sentiment of each text as positive or negative."""
+
+    texts: List[str] = dspy.InputField(desc="The texts to classify")
+    sentiments: List[Literal["positive", "negative"]] = dspy.OutputField(
+        desc="One of 'positive' or 'negative' per text, in the same order"
+    )
+
+
+class BatchSentimentClassifier(dspy.Module):
+    """
+    Sentiment classifier that packs several texts into a single LLM call.
+
+    Used by evaluate_model(batch_model_class=...) to cut per-request overhead
+    during evaluation. GEPA still optimizes the single-example
+    SentimentClassifier; from_module() carries its optimized instructions and
+    demos over so the batch program scores the same prompt.
+    """
+
+    task = "sentiment"
+    adapter = dspy.JSONAdapter()
+
+    def __init__(self):
+        super().__init__()
+        self.classify = dspy.Predict(BatchSentimentClassification)
+
+    @classmethod
+    def from_module(cls, module: SentimentClassifier) -> "BatchSentimentClassifier":
+        """
+        Build a batch classifier that uses another classifier's prompt.
+
+        Args:
+            module: SentimentClassifier (e.g. a GEPA-optimized one)
+
+        Returns:
+            BatchSentimentClassifier with the same instructions and demos
+        """
+        batch = cls()
+        source = module.classify
+        batch.classify.signature = batch.classify.signature.with_instructions(
+            source.signature.instructions
+        )
+
+        # Pack the single-example demos into one batch demo
+        demos = [demo for demo in source.demos if "text" in demo and "sentiment" in demo]
+        if demos:
+            batch.classify.demos = [dspy.Example(
+                texts=[demo["text"] for demo in demos],
+                sentiments=[demo["sentiment"] for demo in demos],
+            )]
+        return batch
+
+    def forward(self, inputs):
+        """
+        Classify the sentiment of a batch of texts.
+
+        Args:
+            inputs: List of input dicts, each with a text field
+
+        Returns:
+            List of Predictions with sentiment field, one per input
+
+        Raises:
+            ValueError: If the model returns a different number of labels than
+                texts, since labels can't then be matched to their inputs
+        """
+        texts = [item["text"] for item in inputs]
+        with task_lm(self.task), dspy.context(adapter=self.adapter):
+            result = self.classify(texts=texts)
+
+        sentiments = list(result.sentiments)
+        if len(sentiments) != len(texts):
+            raise ValueError(
+                f"Expected {len(texts)} sentiment labels, got {len(sentiments)}"
+            )
+        return [dspy.Prediction(sentiment=sentiment) for sentiment in sentiments]
@@ -0,0 +1,19 @@
+"""
+Text normalization shared by datasets and metrics.
+"""
+
+import re
+
+
+_WS = re.compile(r"\s+")
+_PUNCT = re.compile(r"^[\W_]+|[\W_]+$")
+
+
+def normalize(text: str) -> str:
+    """
+    Normalize an answer string for exact-match comparison.
+
+    Lowercases, strips surrounding punctuation and whitespace, and collapses
+    internal whitespace to single spaces.
+    """
+    return _WS.sub(" ", _PUNCT.sub("", text.lower()))
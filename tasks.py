@@ -1,8 +1,8 @@
 """Task registry and configuration for DSPy GEPA examples."""
 
 from datasets import get_sentiment_data, get_qa_data, get_math_data
-from models import SentimentClassifier, QAModule, MathSolver
-from metrics import sentiment_accuracy, qa_accuracy, math_accuracy
+from models import SentimentClassifier, BatchSentimentClassifier, QAModule, MathSolver
+from metrics import sentiment_accuracy, sentiment_accuracy_batch, qa_accuracy, math_accuracy
 
 
 # Task Configuration Registry
@@ -11,27 +11,42 @@ TASKS = {
         "name": "Sentiment Classification",
         "get_data": get_sentiment_data,
         "model_class": SentimentClassifier,
+        "batch_model_class": BatchSentimentClassifier,  # Packs examples per call in evaluate_model
         "metric": sentiment_accuracy,
+        "batch_metric": sentiment_accuracy_batch,  # Vectorized metric for evaluate_model
         "gepa_auto": "light",  # Light optimization for simple task
+        "gepa_num_threads": 8,  # Candidate evaluations run in parallel
+        "lm_model": "openai/gpt-4.1-nano",  # Binary classification runs fine on a small model
         "input_fields": ["text"],
         "output_field": "sentiment",
+        "batch": False,  # Evaluate through the OpenAI Batch API (offline, 50% cheaper)
     },
     "qa": {
         "name": "Question Answering",
         "get_data": get_qa_data,
         "model_class": QAModule,
+        "batch_model_class": None,
         "metric": qa_accuracy,
+        "batch_metric": None,
         "gepa_auto": "medium",  # Medium optimization for multi-input task
+        "gepa_num_threads": 8,  # Candidate evaluations run in parallel
+        "lm_model": "openai/gpt-5-mini",
         "input_fields": ["question", "context"],
         "output_field": "answer",
+        "batch": False,
     },
     "math": {
         "name": "Math Word Problems (ReAct)",
         "get_data": get_math_data,
         "model_class": MathSolver,
+        "batch_model_class": None,
         "metric": math_accuracy,
+        "batch_metric": None,
         "gepa_auto": "light",  # Light optimization to reduce LLM call volume
+        "gepa_num_threads": 4,  # ReAct makes several calls per example, so fewer threads
+        "lm_model": "openai/gpt-5-mini",
         "input_fields": ["problem"],
         "output_field": "answer",
+        "batch": False,  # ReAct makes multiple LLM calls per example, so batch is unsupported
     },
 }